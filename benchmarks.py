@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+# the benchmarks of the optimized paths against the legacy ones,run it by:python benchmarks.py
+# the mocks and legacy implementations are shared with the tests by zvt.mocks,
+# the data recorded by the benchmarks is saved to a temp DATA_PATH
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from unittest import mock
+
+import pandas as pd
+
+
+def bench_to_time_str(count=10000):
+    import arrow
+
+    from zvt.utils.time_utils import to_time_str, to_pd_timestamp, TIME_FORMAT_ISO8601
+
+    timestamps = pd.date_range('2019-01-01 09:30:00.123', periods=count, freq='17min').tolist()
+
+    start = time.time()
+    for timestamp in timestamps:
+        arrow.get(to_pd_timestamp(timestamp)).format(TIME_FORMAT_ISO8601)
+    legacy_cost = (time.time() - start) / count
+
+    start = time.time()
+    for timestamp in timestamps:
+        to_time_str(timestamp, fmt=TIME_FORMAT_ISO8601)
+    cost = (time.time() - start) / count
+
+    print('to_time_str per call,arrow:{:.2f}us,strftime:{:.2f}us'.format(legacy_cost * 1e6, cost * 1e6))
+
+
+def bench_import_domain():
+    script = '''
+import time
+
+start = time.time()
+
+from zvt import settings
+settings.DATA_PATH = {data_path!r}
+
+import zvt.domain
+import zvt.api.rules
+from zvt.domain import _db_engine_map
+
+print('engines:{{}},import cost:{{:.3f}}s'.format(len(_db_engine_map), time.time() - start))
+'''
+    with tempfile.TemporaryDirectory() as data_path:
+        subprocess.run([sys.executable, '-c', script.format(data_path=data_path)],
+                       cwd=os.path.abspath(os.path.dirname(__file__)))
+
+
+def bench_sqlite_pragmas(rows=3000):
+    from sqlalchemy import create_engine
+
+    from zvt.domain import apply_sqlite_pragmas, get_sqlite_pragmas, StoreCategory
+    from zvt.mocks import run_workload
+
+    with tempfile.TemporaryDirectory() as data_path:
+        for name, pragmas in [('default', None), ('tuned', get_sqlite_pragmas(StoreCategory.stock_1d_kdata))]:
+            engine = create_engine('sqlite:///' + os.path.join(data_path, '{}.db'.format(name)))
+            if pragmas:
+                apply_sqlite_pragmas(engine, pragmas)
+
+            cost, read_count, read_errors = run_workload(engine, rows=rows)
+            print('{} pragmas,write:{:.0f} rows/s,read:{:.0f} queries/s,read errors:{}'.format(
+                name, rows / cost, read_count / cost, read_errors))
+            engine.dispose()
+
+
+def bench_domain_mapper(size=2000):
+    from zvt.domain.finance import BalanceSheet, FinanceFactor
+    from zvt.utils.utils import get_domain_mapper
+    from zvt.mocks import legacy_fill_domain_from_dict, mock_data_map, mock_dict_list
+
+    for data_schema in [BalanceSheet, FinanceFactor]:
+        data_map = mock_data_map(data_schema)
+        dict_list = mock_dict_list(data_map, size)
+
+        start = time.time()
+        for the_dict in dict_list:
+            legacy_fill_domain_from_dict(data_schema(), the_dict, data_map)
+        legacy_cost = time.time() - start
+
+        start = time.time()
+        mapper = get_domain_mapper(data_schema, data_map)
+        for the_dict in dict_list:
+            mapper.fill(data_schema(), the_dict)
+        cost = time.time() - start
+
+        print('fill {} {} fields of {},exec:{:.3f}s,mapper:{:.3f}s'.format(size, len(data_map), data_schema.__name__,
+                                                                          legacy_cost, cost))
+
+
+def bench_to_float_array(size=100000):
+    from zvt.utils.utils import to_float, to_float_array
+    from zvt.mocks import mock_number_strings, to_expected
+
+    for values in mock_number_strings(size):
+        start = time.time()
+        to_expected(values, to_float)
+        cost = time.time() - start
+
+        start = time.time()
+        to_float_array(values)
+        array_cost = time.time() - start
+
+        print('to_float {} values,scalar:{:.3f}s,array:{:.3f}s'.format(len(values), cost, array_cost))
+
+
+def bench_position_panel(security_count=300):
+    from zvt.mocks import mock_uneven_df, compute_by_loop, compute_by_panel
+
+    df = mock_uneven_df(security_count)
+
+    start = time.time()
+    compute_by_loop(df)
+    loop_cost = time.time() - start
+
+    start = time.time()
+    compute_by_panel(df)
+    panel_cost = time.time() - start
+
+    print('ma and macd of {} securities,loop:{:.3f}s,panel:{:.3f}s'.format(security_count, loop_cost, panel_cost))
+
+
+def bench_quantile_score(security_count=3600, periods=10):
+    from zvt.factors.factor import quantile_score
+    from zvt.mocks import SCORE_LEVELS, mock_depth_df, legacy_quantile_score
+
+    # the full market
+    depth_df = mock_depth_df(security_count=security_count, periods=periods)
+    factors = ['roe', 'rota']
+
+    start = time.time()
+    legacy_quantile_score(depth_df, factors, SCORE_LEVELS)
+    legacy_cost = time.time() - start
+
+    start = time.time()
+    quantile = depth_df.loc[:, factors].groupby(level=1).quantile(SCORE_LEVELS)
+    quantile_score(depth_df, quantile, factors, SCORE_LEVELS)
+    cost = time.time() - start
+
+    print('quantile score of {} securities × {} timestamps,apply:{:.3f}s,vectorized:{:.3f}s'.format(
+        security_count, periods, legacy_cost, cost))
+
+
+def bench_parallel_depth_computing(security_count=500, periods=500):
+    from zvt.factors.factor import compute_depth_df_parallel
+    from zvt.factors.technical_factor import TechnicalFactor
+    from zvt.mocks import mock_kdata
+
+    security_ids = ['stock_sz_{:06d}'.format(i) for i in range(security_count)]
+    kdata = mock_kdata(security_ids, periods=periods)
+
+    def get_data(start_timestamp=None, end_timestamp=None, **kwargs):
+        return kdata[(kdata['timestamp'] >= start_timestamp) & (kdata['timestamp'] <= end_timestamp)].copy()
+
+    with mock.patch('zvt.reader.reader.get_data', get_data):
+        factor = TechnicalFactor(security_list=security_ids, start_timestamp=kdata['timestamp'].min(),
+                                 end_timestamp=kdata['timestamp'].max(),
+                                 indicators=['ma', 'macd', 'rsi', 'kdj', 'boll', 'atr'],
+                                 indicators_param=[{'window': 5}, {'slow': 26, 'fast': 12, 'n': 9}, {'window': 6}, {},
+                                                   {'window': 20}, {'window': 14}])
+
+    costs = []
+    for workers in [1, 2, 4, 8]:
+        start = time.time()
+        if workers == 1:
+            factor.compute_depth_df(factor.data_df)
+        else:
+            compute_depth_df_parallel(factor, factor.data_df, workers)
+        costs.append('{} workers:{:.3f}s'.format(workers, time.time() - start))
+
+    print('depth df of {} securities × {} timestamps,{}'.format(security_count, periods, ','.join(costs)))
+
+
+def bench_target_index():
+    from zvt.domain import TradingLevel
+    from zvt.trader.trader import LimitSelectorsComparator
+    from zvt.mocks import MockSelector, legacy_make_decision
+
+    selector = MockSelector(start_timestamp='2018-01-01', end_timestamp='2019-12-31')
+    selector.run()
+    comparator = LimitSelectorsComparator([selector], limit=10)
+    timestamps = pd.date_range('2018-01-01', '2019-12-31')
+
+    start = time.time()
+    for timestamp in timestamps:
+        legacy_make_decision(selector.get_result_df(), timestamp, limit=10)
+    legacy_cost = time.time() - start
+
+    start = time.time()
+    for timestamp in timestamps:
+        comparator.select_targets(timestamp, TradingLevel.LEVEL_1DAY)
+    index_cost = time.time() - start
+
+    print('select targets of {} timestamps,legacy:{:.3f}s,index:{:.3f}s'.format(len(timestamps), legacy_cost,
+                                                                               index_cost))
+
+
+def bench_vectorized_trader():
+    from zvt.mocks import MockTrader, SECURITY_IDS, mock_price_panel
+
+    price_panel = mock_price_panel('2019-01-01', '2019-06-30')
+    with mock.patch('zvt.trader.trader.get_kdata_panel', lambda **kwargs: price_panel):
+        start = time.time()
+        MockTrader(security_list=SECURITY_IDS, start_timestamp='2019-01-01', end_timestamp='2019-06-30',
+                   trader_name='bench_event_trader', provider='joinquant', batch_persist=True).run()
+        event_cost = time.time() - start
+
+        start = time.time()
+        MockTrader(security_list=SECURITY_IDS, start_timestamp='2019-01-01', end_timestamp='2019-06-30',
+                   trader_name='bench_vectorized_trader', provider='joinquant').run_vectorized()
+        vectorized_cost = time.time() - start
+
+    print('backtest,event:{:.3f}s,vectorized:{:.3f}s'.format(event_cost, vectorized_cost))
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as the_data_path:
+        # zvt.domain binds the DATA_PATH when importing,so set it before importing any zvt.domain module
+        from zvt import settings
+
+        settings.DATA_PATH = the_data_path
+
+        bench_to_time_str()
+        bench_import_domain()
+        bench_sqlite_pragmas()
+        bench_domain_mapper()
+        bench_to_float_array()
+        bench_position_panel()
+        bench_quantile_score()
+        bench_parallel_depth_computing()
+        bench_target_index()
+        bench_vectorized_trader()